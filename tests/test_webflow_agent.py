@@ -0,0 +1,331 @@
+import argparse
+import json
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from webflow_agent import CACHE_MAX_ENTRIES, WebflowAgent, WebflowAgentError, _write_bytes, run_command
+
+
+TOTAL_ITEMS = 250
+ITEMS = [{"id": f"item{i}", "fieldData": {"name": f"Item {i}"}} for i in range(TOTAL_ITEMS)]
+
+
+def make_response(status_code, body=None, etag=None):
+    """Build a requests.Response as the session would return it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8") if body is not None else b""
+    if etag is not None:
+        response.headers["ETag"] = etag
+    return response
+
+
+class FakeWebflowAPI:
+    """Answers collection requests from ITEMS, replying 304 when the ETag matches."""
+
+    def __init__(self):
+        self.requests = []
+        self.payloads = []
+
+    def __call__(self, method, url, json=None, headers=None, **kwargs):
+        self.requests.append((method, url, headers))
+        self.payloads.append(json)
+        if method == "PATCH":
+            # Bulk updates echo the updated items back, single updates the item itself
+            return make_response(200, {"items": json["items"]} if "items" in json else json)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return make_response(304)
+
+        match = re.search(r"limit=(\d+)&offset=(\d+)", url)
+        if match:
+            limit, offset = int(match.group(1)), int(match.group(2))
+            body = {"items": ITEMS[offset:offset + limit], "pagination": {"total": TOTAL_ITEMS}}
+        else:
+            body = {"id": url.rsplit("/", 1)[-1], "fieldData": {"name": "Item"}}
+        return make_response(200, body, etag='"v1"')
+
+
+def make_agent(api, **kwargs):
+    kwargs.setdefault("cache_dir", None)
+    agent = WebflowAgent("token", "site", "collection", **kwargs)
+    agent.session.request = api
+    return agent
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_list_items_after_not_modified_does_not_grow_cached_page(self):
+        api = FakeWebflowAPI()
+        agent = make_agent(api, cache_ttl=0)
+
+        first = agent.list_items()
+        second = agent.list_items()
+
+        self.assertEqual([item["id"] for item in first], [item["id"] for item in ITEMS])
+        self.assertEqual([item["id"] for item in second], [item["id"] for item in ITEMS])
+        self.assertEqual(api.requests[-1][2], {"If-None-Match": '"v1"'})
+
+    def test_list_items_within_ttl_does_not_grow_cached_page(self):
+        api = FakeWebflowAPI()
+        agent = make_agent(api, cache_ttl=60)
+
+        first = agent.list_items()
+        requests_made = len(api.requests)
+        second = agent.list_items()
+
+        self.assertEqual(len(api.requests), requests_made)
+        self.assertEqual(len(first), TOTAL_ITEMS)
+        self.assertEqual(len(second), TOTAL_ITEMS)
+
+    def test_mutating_get_item_result_does_not_change_cached_item(self):
+        api = FakeWebflowAPI()
+        agent = make_agent(api, cache_ttl=60)
+
+        agent.get_item("abc")["fieldData"]["name"] = "Changed"
+
+        self.assertEqual(agent.get_item("abc")["fieldData"]["name"], "Item")
+        self.assertEqual(len(api.requests), 1)
+
+    def test_memory_cache_keeps_only_most_recent_entries(self):
+        api = FakeWebflowAPI()
+        agent = make_agent(api, cache_ttl=60)
+
+        for i in range(CACHE_MAX_ENTRIES + 100):
+            agent.get_item(f"item{i}")
+        requests_made = len(api.requests)
+
+        self.assertEqual(len(agent._response_cache._entries), CACHE_MAX_ENTRIES)
+        agent.get_item(f"item{CACHE_MAX_ENTRIES + 99}")
+        self.assertEqual(len(api.requests), requests_made)
+        agent.get_item("item0")
+        self.assertEqual(len(api.requests), requests_made + 1)
+
+    def test_not_modified_after_eviction_refetches_body(self):
+        api = FakeWebflowAPI()
+        agent = make_agent(api, cache_ttl=0)
+        agent.get_item("abc")
+        agent._response_cache.body = lambda url: None
+
+        item = agent.get_item("abc")
+
+        self.assertEqual(item["id"], "abc")
+        self.assertEqual(api.requests[-2][2], {"If-None-Match": '"v1"'})
+        self.assertIsNone(api.requests[-1][2])
+
+
+class MakeRequestTest(unittest.TestCase):
+    def test_non_json_body_raises_agent_error(self):
+        def html_page(method, url, **kwargs):
+            response = make_response(200)
+            response._content = b"<html>Bad gateway</html>"
+            return response
+
+        agent = make_agent(html_page)
+
+        with self.assertRaises(WebflowAgentError) as ctx:
+            agent.get_item("abc")
+        self.assertEqual(ctx.exception.response.status_code, 200)
+
+
+class GetItemsTest(unittest.TestCase):
+    def test_non_positive_concurrency_fetches_sequentially(self):
+        agent = make_agent(FakeWebflowAPI())
+
+        items = agent.get_items(["a", "b"], concurrency=0)
+
+        self.assertEqual([item["id"] for item in items], ["a", "b"])
+
+
+class UpdateItemsTest(unittest.TestCase):
+    def test_updates_are_sent_in_chunks_of_100(self):
+        api = FakeWebflowAPI()
+        agent = make_agent(api)
+        updates = [{"id": f"item{i}", "fieldData": {"name": f"New {i}"}} for i in range(250)]
+
+        results = agent.update_items(updates)
+
+        self.assertEqual([method for method, _, _ in api.requests], ["PATCH"] * 3)
+        self.assertEqual({url for _, url, _ in api.requests}, {"https://api.webflow.com/v2/collections/collection/items"})
+        self.assertEqual(sorted(len(payload["items"]) for payload in api.payloads), [50, 100, 100])
+        self.assertEqual([item["id"] for item in results], [update["id"] for update in updates])
+
+    def test_only_updatable_fields_are_sent(self):
+        api = FakeWebflowAPI()
+        agent = make_agent(api)
+
+        agent.update_items([{"id": "a", "fieldData": {"name": "A"}, "isDraft": True, "slug": "a", "createdOn": "x"}])
+
+        self.assertEqual(api.payloads, [{"items": [{"id": "a", "fieldData": {"name": "A"}, "isDraft": True}]}])
+
+    def test_no_updates_makes_no_requests(self):
+        api = FakeWebflowAPI()
+
+        self.assertEqual(make_agent(api).update_items([]), [])
+        self.assertEqual(api.requests, [])
+
+
+class UpdateBatchCommandTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.api = FakeWebflowAPI()
+        self.agent = make_agent(self.api)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def run_update_batch(self, updates):
+        path = os.path.join(self._tmp.name, "updates.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(updates, f)
+        run_command(self.agent, argparse.Namespace(command="update-batch", file=path), parser=None)
+
+    def test_applies_updates_from_file(self):
+        self.run_update_batch([{"id": "a", "fieldData": {"name": "A"}}, {"id": "b", "isArchived": True}])
+
+        self.assertEqual(self.api.payloads, [{"items": [{"id": "a", "fieldData": {"name": "A"}}, {"id": "b", "isArchived": True}]}])
+
+    def test_rejects_file_that_is_not_a_list(self):
+        self.run_update_batch({"id": "a", "fieldData": {"name": "A"}})
+
+        self.assertEqual(self.api.requests, [])
+
+    def test_rejects_updates_without_id(self):
+        self.run_update_batch([{"id": "a", "fieldData": {}}, {"fieldData": {"name": "B"}}])
+
+        self.assertEqual(self.api.requests, [])
+
+    def test_rejects_invalid_json(self):
+        path = os.path.join(self._tmp.name, "updates.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[{")
+
+        run_command(self.agent, argparse.Namespace(command="update-batch", file=path), parser=None)
+
+        self.assertEqual(self.api.requests, [])
+
+
+class SaveContentTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self._tmp.name
+        self.agent = make_agent(FakeWebflowAPI())
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_item_names_are_sanitized_into_filenames(self):
+        cases = {
+            "Google Ads": "google_ads_abc.json",
+            "A/B Testing": "a_b_testing_abc.json",
+            "../../etc/passwd": "_etc_passwd_abc.json",
+            "Setup: Step 1": "setup_step_1_abc.json",
+            "Two  spaces - here": "two_spaces_-_here_abc.json",
+        }
+        for name, filename in cases.items():
+            with self.subTest(name=name):
+                item = {"id": "abc", "fieldData": {"name": name}}
+
+                file_path = self.agent.save_content_to_file(item, {"name": name}, self.base_dir)
+
+                self.assertEqual(file_path, os.path.join(self.base_dir, filename))
+                with open(file_path, encoding="utf-8") as f:
+                    self.assertEqual(json.load(f), {"name": name})
+
+    def test_item_without_field_data_is_saved_as_untitled(self):
+        file_path = self.agent.save_content_to_file({"id": "abc"}, "text", self.base_dir)
+
+        self.assertEqual(file_path, os.path.join(self.base_dir, "untitled_abc.json"))
+
+    def test_failed_replace_keeps_old_file_and_removes_temporary_file(self):
+        file_path = os.path.join(self.base_dir, "content.json")
+        _write_bytes(file_path, b"old")
+
+        with mock.patch("webflow_agent.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                _write_bytes(file_path, b"new")
+
+        with open(file_path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(os.listdir(self.base_dir), ["content.json"])
+
+    def test_failed_write_keeps_old_file_and_removes_temporary_file(self):
+        file_path = os.path.join(self.base_dir, "content.json")
+        _write_bytes(file_path, b"old")
+
+        with self.assertRaises(TypeError):
+            _write_bytes(file_path, "not bytes")
+
+        with open(file_path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(os.listdir(self.base_dir), ["content.json"])
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_later_agent_revalidates_from_disk(self):
+        make_agent(FakeWebflowAPI(), cache_dir=self.cache_dir).get_item("abc")
+
+        api = FakeWebflowAPI()
+        item = make_agent(api, cache_dir=self.cache_dir).get_item("abc")
+
+        self.assertEqual(item["id"], "abc")
+        self.assertEqual(api.requests[0][2], {"If-None-Match": '"v1"'})
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    def test_cache_directory_and_files_are_private(self):
+        cache_dir = os.path.join(self.cache_dir, "webflow-agent")
+        make_agent(FakeWebflowAPI(), cache_dir=cache_dir).get_item("abc")
+
+        self.assertEqual(os.stat(cache_dir).st_mode & 0o077, 0)
+        for name in os.listdir(cache_dir):
+            self.assertEqual(os.stat(os.path.join(cache_dir, name)).st_mode & 0o077, 0)
+
+    def test_corrupt_entry_is_discarded_and_refetched(self):
+        make_agent(FakeWebflowAPI(), cache_dir=self.cache_dir).get_item("abc")
+        [name] = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, name), "wb") as f:
+            f.write(b'"v1"\n{"id": "abc", "fieldDa')
+
+        api = FakeWebflowAPI()
+        item = make_agent(api, cache_dir=self.cache_dir).get_item("abc")
+
+        self.assertEqual(item["id"], "abc")
+        self.assertEqual(api.requests[0][2], {"If-None-Match": '"v1"'})
+        self.assertIsNone(api.requests[1][2])
+        with open(os.path.join(self.cache_dir, name), "rb") as f:
+            self.assertEqual(json.loads(f.read().split(b"\n", 1)[1])["id"], "abc")
+
+    def test_entry_without_etag_is_discarded(self):
+        make_agent(FakeWebflowAPI(), cache_dir=self.cache_dir).get_item("abc")
+        [name] = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, name), "wb") as f:
+            f.write(b"")
+
+        api = FakeWebflowAPI()
+        make_agent(api, cache_dir=self.cache_dir).get_item("abc")
+
+        self.assertIsNone(api.requests[0][2])
+
+    def test_disk_cache_is_evicted_past_size_limit(self):
+        agent = make_agent(FakeWebflowAPI(), cache_dir=self.cache_dir, cache_size_limit=500)
+
+        for i in range(20):
+            agent.get_item(f"item{i}")
+
+        usage = sum(os.path.getsize(os.path.join(self.cache_dir, name)) for name in os.listdir(self.cache_dir))
+        self.assertLessEqual(usage, 500)
+        self.assertGreater(usage, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
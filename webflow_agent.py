@@ -8,14 +8,28 @@ A script to interact with Webflow's Data API v2 for managing documentation conte
 import os
 import sys
 import json
-from typing import Dict, List, Any, Optional
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.progress import Progress
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Initialize console for rich output
 console = Console()
 
@@ -27,82 +41,440 @@ API_TOKEN = os.getenv("WEBFLOW_API_TOKEN")
 SITE_ID = os.getenv("WEBFLOW_SITE_ID")
 COLLECTION_ID = os.getenv("WEBFLOW_COLLECTION_ID")
 API_BASE_URL = "https://api.webflow.com/v2"
+CACHE_TTL = 60
+CACHE_SIZE_LIMIT = 100_000_000
+CACHE_MAX_ENTRIES = 512
+CACHE_DIR = os.getenv("WEBFLOW_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "webflow-agent"))
+
+# HTTP methods supported by _make_request
+SUPPORTED_METHODS = frozenset({"get", "post", "patch", "delete"})
+
+# Item properties accepted by the update endpoints
+UPDATABLE_FIELDS = ("fieldData", "isArchived", "isDraft", "cmsLocaleId")
+
+# Maximum number of items accepted by a single bulk update request
+BULK_UPDATE_LIMIT = 100
+
+# Connect and read timeouts for API requests, in seconds
+REQUEST_TIMEOUT = (5.0, 30.0)
+
+# Maximum number of requests issued concurrently (matches the session pool size)
+MAX_CONCURRENT_REQUESTS = 20
+
+class WebflowAgentError(Exception):
+    """Raised when a request to the Webflow API fails."""
+    
+    def __init__(self, message: str, response: Optional[requests.Response] = None):
+        super().__init__(message)
+        self.response = response
+
+
+# Characters replaced with "_" when turning item names into filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-]+")
+
+# Shared, never-mutated default for items without fieldData
+_EMPTY_FIELD_DATA: Dict = {}
+
+
+# Encoder reused by the stdlib fallback of _json_dumps
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(obj).encode("utf-8")
+
+
+def _simplify_item(item: Dict) -> Dict:
+    """Reduce an item to the essential information used for searching."""
+    get = item.get
+    field_data = get("fieldData") or _EMPTY_FIELD_DATA
+    return {
+        "id": get("id", ""),
+        "name": field_data.get("name", "Untitled"),
+        "lastUpdated": get("lastUpdated", ""),
+        "createdOn": get("createdOn", ""),
+        "slug": field_data.get("slug", ""),
+        # Add any other fields that would be useful for searching
+    }
+
+
+def _write_bytes(file_path: str, data: bytes, mode: int = 0o666) -> None:
+    """
+    Write already-encoded bytes to a file in a single call.
+    
+    The data is written to a temporary file next to the target and then moved
+    into place, so readers never see a partially written file. The file is
+    created with the given permission bits (still subject to the umask).
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with open(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Directories already created by this process
+_CREATED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and its parents), touching the filesystem only once per path."""
+    if path in _CREATED_DIRS:
+        return
+    Path(path).mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
+
+class _ResponseCache:
+    """
+    ETag-validated cache of GET response bodies.
+    
+    Raw bodies of the max_entries most recently used URLs are kept in memory
+    and are decoded afresh on every hit, so callers never share (or mutate) a cached
+    object. A body is served without any request for ttl seconds after it was
+    fetched or revalidated. When a directory is given, the ETag and raw body of
+    each response are also stored on disk so later runs can revalidate instead
+    of re-downloading; the least recently used files are evicted once the
+    directory grows past size_limit bytes. Responses require the API token and
+    may contain draft content, so the directory and files are private to the
+    current user.
+    """
+    
+    def __init__(self, directory: Optional[str] = None, ttl: float = 0, size_limit: int = CACHE_SIZE_LIMIT,
+                 max_entries: int = CACHE_MAX_ENTRIES):
+        self.directory = directory
+        self.ttl = ttl
+        self.size_limit = size_limit
+        self.max_entries = max_entries
+        # URL -> (ETag, raw body, monotonic time it was known to be current), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Optional[str], bytes, float]]" = OrderedDict()
+        self._entries_lock = threading.Lock()
+        # Bytes used by the disk cache, unknown until the directory is first scanned
+        self._disk_usage: Optional[int] = None
+        self._directory_created = False
+        self._disk_lock = threading.Lock()
+    
+    def _path(self, url: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest())
+    
+    def _get_entry(self, url: str) -> Optional[Tuple[Optional[str], bytes, float]]:
+        with self._entries_lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+    
+    def _set_entry(self, url: str, entry: Tuple[Optional[str], bytes, float]) -> None:
+        with self._entries_lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            # Evict the least recently used bodies once the cache is full
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def fresh(self, url: str) -> Optional[Dict]:
+        """Return the cached body for a URL if it is still within its TTL."""
+        entry = self._get_entry(url)
+        if entry is not None and time.monotonic() - entry[2] < self.ttl:
+            return _json_loads(entry[1])
+        return None
+    
+    def etag(self, url: str) -> Optional[str]:
+        """
+        Return the cached ETag for a URL, if any.
+        
+        Disk entries are read here, before the ETag is sent, so an unreadable
+        file is discarded and treated as a miss. Their bodies are only decoded
+        by body(), once the server has confirmed they are still current.
+        """
+        entry = self._get_entry(url)
+        if entry is not None:
+            return entry[0]
+        
+        path = self._path(url)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                etag = f.readline().rstrip(b"\n").decode("utf-8")
+                content = f.read()
+            if not etag:
+                raise ValueError("cache entry has no ETag")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._discard(url)
+            return None
+        
+        self._set_entry(url, (etag, content, float("-inf")))
+        return etag
+    
+    def body(self, url: str) -> Optional[Dict]:
+        """
+        Return the cached body for a URL whose ETag was just revalidated.
+        
+        Returns None if the entry was evicted in the meantime or cannot be
+        decoded, in which case the caller has to fetch the body again.
+        """
+        entry = self._get_entry(url)
+        if entry is None:
+            return None
+        etag, content, _ = entry
+        
+        try:
+            result = _json_loads(content)
+        except ValueError:
+            # A corrupt or hand-edited disk entry; drop it so it is not revalidated again
+            self._discard(url)
+            return None
+        
+        # A successful revalidation makes the body current again
+        self._set_entry(url, (etag, content, time.monotonic()))
+        path = self._path(url)
+        if path is not None:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return result
+    
+    def _discard(self, url: str) -> None:
+        """Forget a URL's cached response, in memory and on disk."""
+        with self._entries_lock:
+            self._entries.pop(url, None)
+        path = self._path(url)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def store(self, url: str, etag: Optional[str], content: bytes) -> None:
+        """Cache a response's ETag together with its raw body."""
+        if etag is None and self.ttl <= 0:
+            return
+        self._set_entry(url, (etag, content, time.monotonic()))
+        
+        path = self._path(url)
+        if path is None or etag is None:
+            return
+        # The disk cache is best-effort: a failed write only costs a later re-download
+        data = etag.encode("utf-8") + b"\n" + content
+        try:
+            if not self._directory_created:
+                Path(self.directory).mkdir(mode=0o700, parents=True, exist_ok=True)
+                self._directory_created = True
+            _write_bytes(path, data, mode=0o600)
+            with self._disk_lock:
+                if self._disk_usage is not None:
+                    self._disk_usage += len(data)
+                if self._disk_usage is None or self._disk_usage > self.size_limit:
+                    self._evict()
+        except OSError:
+            pass
+    
+    def _evict(self) -> None:
+        """Delete the least recently used disk entries until the cache fits in size_limit."""
+        files = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                # Skip temporary files that are still being written by _write_bytes
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+                except OSError:
+                    continue
+        
+        usage = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if usage <= self.size_limit:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            usage -= size
+        self._disk_usage = usage
+    
+    def expire(self) -> None:
+        """Mark every cached body as stale so it is revalidated before reuse."""
+        with self._entries_lock:
+            for url, (etag, content, _) in self._entries.items():
+                self._entries[url] = (etag, content, float("-inf"))
+
 
 class WebflowAgent:
     """Agent for interacting with Webflow Data API v2."""
     
-    def __init__(self, token: str, site_id: str, collection_id: str):
-        """Initialize the Webflow agent with API credentials."""
+    def __init__(self, token: str, site_id: str, collection_id: str, base_url: str = API_BASE_URL,
+                 cache_dir: Optional[str] = None, cache_ttl: float = CACHE_TTL,
+                 cache_size_limit: int = CACHE_SIZE_LIMIT):
+        """
+        Initialize the Webflow agent with API credentials.
+        
+        GET responses are reused without a request for cache_ttl seconds, and
+        are revalidated by ETag afterwards. Pass a cache_dir (e.g. CACHE_DIR) to
+        also keep them on disk, up to cache_size_limit bytes, so repeated runs
+        only revalidate them. Pass cache_ttl=0 to always revalidate.
+        """
         self.token = token
         self.site_id = site_id
         self.collection_id = collection_id
+        self.base_url = base_url
+        # Endpoint of the collection's items, shared by all item requests
+        self._items_endpoint = f"/collections/{collection_id}/items"
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
         
+        # Reuse one session so requests share pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # Retry transient failures with exponential backoff, honouring Retry-After on 429s
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(method.upper() for method in SUPPORTED_METHODS),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=retry))
+        
+        # ETag and body of previous GET responses, keyed by URL
+        self._response_cache = _ResponseCache(cache_dir, cache_ttl, cache_size_limit)
+        
+    @property
+    def session(self) -> requests.Session:
+        """The pooled HTTP session used for API requests, e.g. to configure proxies or hooks."""
+        return self._session
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "WebflowAgent":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
-        """Make a request to the Webflow API."""
-        url = f"{API_BASE_URL}{endpoint}"
+        """
+        Make a request to the Webflow API.
+        
+        Raises:
+            WebflowAgentError: If the request still fails after retries
+        """
+        url = self.base_url + endpoint
+        method = method.lower()
+        
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        # Reuse recently fetched resources, and revalidate older ones instead of re-downloading them
+        headers = None
+        cached_etag = None
+        if method == "get":
+            cached = self._response_cache.fresh(url)
+            if cached is not None:
+                return cached
+            
+            cached_etag = self._response_cache.etag(url)
+            if cached_etag is not None:
+                headers = {"If-None-Match": cached_etag}
         
         try:
-            if method.lower() == "get":
-                response = requests.get(url, headers=self.headers)
-            elif method.lower() == "post":
-                response = requests.post(url, headers=self.headers, json=data)
-            elif method.lower() == "patch":
-                response = requests.patch(url, headers=self.headers, json=data)
-            elif method.lower() == "delete":
-                response = requests.delete(url, headers=self.headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            response = self._session.request(method.upper(), url, json=data, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached_etag is not None:
+                cached = self._response_cache.body(url)
+                if cached is not None:
+                    return cached
+                # The cached body is gone or unreadable, so fetch it again unconditionally
+                response = self._session.request(method.upper(), url, json=data, timeout=REQUEST_TIMEOUT)
             
             response.raise_for_status()
-            return response.json()
+            try:
+                result = _json_loads(response.content)
+            except ValueError as e:
+                raise WebflowAgentError(f"Invalid JSON in response from {url}: {e}", response) from e
+            
+            if method == "get":
+                self._response_cache.store(url, response.headers.get("ETag") or None, response.content)
+            else:
+                # Writes may change any item or list page, so stop serving cached copies unvalidated
+                self._response_cache.expire()
+            
+            return result
         except requests.exceptions.RequestException as e:
-            console.print(f"[bold red]Error making request:[/bold red] {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                console.print(f"Response: {e.response.text}")
-            sys.exit(1)
+            raise WebflowAgentError(str(e), getattr(e, 'response', None)) from e
+    
+    def _fetch_page(self, offset: int, limit: int) -> Tuple[List[Dict], int]:
+        """
+        Fetch a single page of collection items.
+        
+        Args:
+            offset (int): Number of items to skip
+            limit (int): Maximum number of items to return
+            
+        Returns:
+            Tuple[List[Dict], int]: The page's items and the collection's total item count
+        """
+        endpoint = f"{self._items_endpoint}?limit={limit}&offset={offset}"
+        response = self._make_request("get", endpoint)
+        return response.get("items", []), response.get("pagination", {}).get("total", 0)
     
-    def list_items(self, limit: int = 100) -> List[Dict]:
+    def list_items(self, limit: int = 100, show_progress: bool = False) -> List[Dict]:
         """
         Get a list of items from the collection.
         
-        This method handles pagination automatically and retrieves all items
-        by making multiple requests if necessary.
+        This method handles pagination automatically. The first page is used to
+        learn the total item count, then all remaining pages are fetched concurrently.
         
         Args:
             limit (int): Maximum number of items to retrieve per request (max 100)
+            show_progress (bool): Display a progress bar while pages are retrieved
             
         Returns:
             List[Dict]: A list of all items in the collection
         """
-        all_items = []
-        offset = 0
-        total_items = None
+        first_page, total_items = self._fetch_page(0, limit)
+        all_items = list(first_page)
         
-        while total_items is None or offset < total_items:
-            endpoint = f"/collections/{self.collection_id}/items?limit={limit}&offset={offset}"
-            response = self._make_request("get", endpoint)
-            
-            # Get items from the current page
-            items = response.get("items", [])
-            all_items.extend(items)
-            
-            # Get pagination info
-            pagination = response.get("pagination", {})
-            total_items = pagination.get("total", 0)
-            
-            # If we got fewer items than the limit, we've reached the end
-            if len(items) < limit:
-                break
-                
-            # Update offset for the next request
-            offset += limit
+        # If we got fewer items than the limit, there is nothing left to fetch
+        if len(all_items) < limit or total_items <= limit:
+            return all_items
+        
+        offsets = range(limit, total_items, limit)
+        with Progress(console=console, transient=True, disable=not show_progress) as progress, \
+                ThreadPoolExecutor(max_workers=min(len(offsets), MAX_CONCURRENT_REQUESTS)) as executor:
+            task = progress.add_task("Retrieving items...", total=total_items, completed=len(all_items))
             
-            # Provide feedback during retrieval of large collections
-            console.print(f"[bold blue]Retrieved {len(all_items)} of {total_items} items...[/bold blue]")
+            # map() yields pages in offset order, so items keep the API's ordering
+            for items, _ in executor.map(lambda offset: self._fetch_page(offset, limit), offsets):
+                all_items.extend(items)
+                progress.update(task, advance=len(items))
         
         return all_items
     
@@ -116,9 +488,30 @@ class WebflowAgent:
         Returns:
             Dict: Item data
         """
-        endpoint = f"/collections/{self.collection_id}/items/{item_id}"
+        endpoint = f"{self._items_endpoint}/{item_id}"
         return self._make_request("get", endpoint)
     
+    def get_items(self, item_ids: List[str], concurrency: int = 10) -> List[Dict]:
+        """
+        Get several items by ID, fetching them concurrently.
+        
+        Rate-limited (429) responses are retried by the session after waiting
+        for the Retry-After delay sent by Webflow.
+        
+        Args:
+            item_ids (List[str]): IDs of the items to retrieve
+            concurrency (int): Maximum number of requests in flight at once
+            
+        Returns:
+            List[Dict]: Item data, in the same order as item_ids
+        """
+        if not item_ids:
+            return []
+        
+        workers = max(1, min(len(item_ids), concurrency, MAX_CONCURRENT_REQUESTS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_item, item_ids))
+    
     def update_item(self, item_id: str, data: Dict) -> Dict:
         """
         Update a specific item.
@@ -130,21 +523,42 @@ class WebflowAgent:
         Returns:
             Dict: Updated item data
         """
-        endpoint = f"/collections/{self.collection_id}/items/{item_id}"
+        endpoint = f"{self._items_endpoint}/{item_id}"
         
         # Ensure data has the correct structure according to the API documentation
-        update_data = {}
-        if "fieldData" in data:
-            update_data["fieldData"] = data["fieldData"]
-        if "isArchived" in data:
-            update_data["isArchived"] = data["isArchived"]
-        if "isDraft" in data:
-            update_data["isDraft"] = data["isDraft"]
-        if "cmsLocaleId" in data:
-            update_data["cmsLocaleId"] = data["cmsLocaleId"]
+        update_data = {key: data[key] for key in UPDATABLE_FIELDS if key in data}
             
         return self._make_request("patch", endpoint, update_data)
     
+    def update_items(self, updates: List[Dict]) -> List[Dict]:
+        """
+        Update several items using Webflow's bulk update endpoint.
+        
+        Updates are sent in chunks of up to 100 items, and the chunks are
+        submitted concurrently.
+        
+        Args:
+            updates (List[Dict]): Item updates, each with an "id" plus fieldData and/or
+                isArchived, isDraft, cmsLocaleId
+            
+        Returns:
+            List[Dict]: Updated item data
+        """
+        endpoint = self._items_endpoint
+        
+        # Ensure each update has the correct structure according to the API documentation
+        items = [
+            {"id": update["id"], **{key: update[key] for key in UPDATABLE_FIELDS if key in update}}
+            for update in updates
+        ]
+        if not items:
+            return []
+        
+        chunks = [items[i:i + BULK_UPDATE_LIMIT] for i in range(0, len(items), BULK_UPDATE_LIMIT)]
+        with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_CONCURRENT_REQUESTS)) as executor:
+            responses = executor.map(lambda chunk: self._make_request("patch", endpoint, {"items": chunk}), chunks)
+            return [item for response in responses for item in response.get("items", [])]
+    
     def save_content_to_file(self, item: Dict, content: Any, base_dir: str = "collection_items") -> str:
         """
         Save the extracted content to a file in the specified directory.
@@ -158,22 +572,24 @@ class WebflowAgent:
             str: Path to the saved file
         """
         # Create the directory if it doesn't exist
-        Path(base_dir).mkdir(exist_ok=True)
+        _ensure_dir(base_dir)
         
         # Get item details for filename
         item_id = item.get("id", "unknown")
-        item_name = item.get("fieldData", {}).get("name", "untitled").replace(" ", "_").lower()
+        field_data = item.get("fieldData") or _EMPTY_FIELD_DATA
+        item_name = _UNSAFE_FILENAME_CHARS.sub("_", field_data.get("name", "untitled").lower())
         
         # Create a filename based on item details
         filename = f"{item_name}_{item_id}.json"
         file_path = os.path.join(base_dir, filename)
         
         # Save the content to the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            if isinstance(content, (dict, list)):
-                json.dump(content, f, indent=2)
-            else:
-                f.write(str(content))
+        if isinstance(content, (dict, list)):
+            data = _json_dumps(content)
+        else:
+            data = str(content).encode("utf-8")
+        
+        _write_bytes(file_path, data)
         
         console.print(f"[bold green]Content saved to:[/bold green] {file_path}")
         return file_path
@@ -191,25 +607,14 @@ class WebflowAgent:
             str: Path to the saved file
         """
         # Create the directory if it doesn't exist
-        Path(base_dir).mkdir(exist_ok=True)
+        _ensure_dir(base_dir)
         
         # Create a simplified version of the items with essential information for searching
-        simplified_items = []
-        for item in items:
-            simplified_item = {
-                "id": item.get("id", ""),
-                "name": item.get("fieldData", {}).get("name", "Untitled"),
-                "lastUpdated": item.get("lastUpdated", ""),
-                "createdOn": item.get("createdOn", ""),
-                "slug": item.get("fieldData", {}).get("slug", ""),
-                # Add any other fields that would be useful for searching
-            }
-            simplified_items.append(simplified_item)
+        simplified_items = list(map(_simplify_item, items))
         
         # Save the simplified items to the file
         file_path = os.path.join(base_dir, filename)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(simplified_items, f, indent=2)
+        _write_bytes(file_path, _json_dumps(simplified_items))
         
         console.print(f"[bold green]Items list saved to:[/bold green] {file_path}")
         return file_path
@@ -249,58 +654,14 @@ def display_item(item: Dict) -> None:
     
     # Display field data in a more readable format
     console.print("[bold]Field Data:[/bold]")
-    console.print(json.dumps(item.get("fieldData", {}), indent=2))
+    console.print(_json_dumps(item.get("fieldData", {})).decode("utf-8"))
 
 
-def main():
-    """Main CLI function for the Webflow Documentation Agent."""
-    import argparse
-    
-    # Create the argument parser
-    parser = argparse.ArgumentParser(description="Webflow Documentation Agent CLI")
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-    
-    # List command
-    list_parser = subparsers.add_parser("list", help="List all documentation items")
-    list_parser.add_argument("--save", action="store_true", help="Save the list to a file")
-    list_parser.add_argument("--output-dir", default="collection_items", help="Directory to save output files")
-    list_parser.add_argument("--filename", default="all_items.json", help="Filename for the saved list")
-    
-    # Get command
-    get_parser = subparsers.add_parser("get", help="Get a specific documentation item")
-    get_parser.add_argument("item_id", help="ID of the item to get")
-    
-    # Extract command
-    extract_parser = subparsers.add_parser("extract", help="Extract content from a documentation item")
-    extract_parser.add_argument("item_id", help="ID of the item to extract content from")
-    extract_parser.add_argument("--save", action="store_true", help="Save the extracted content to a file")
-    extract_parser.add_argument("--output-dir", default="collection_items", help="Directory to save output files")
-    
-    # Update command
-    update_parser = subparsers.add_parser("update", help="Update a documentation item")
-    update_parser.add_argument("item_id", help="ID of the item to update")
-    update_parser.add_argument("--field-data", help="JSON string of field data to update")
-    update_parser.add_argument("--is-archived", type=bool, help="Set item archived status")
-    update_parser.add_argument("--is-draft", type=bool, help="Set item draft status")
-    update_parser.add_argument("--cms-locale-id", help="CMS locale ID for the item")
-    
-    # Parse arguments
-    args = parser.parse_args()
-    
-    # Check for required environment variables
-    if not all([API_TOKEN, SITE_ID, COLLECTION_ID]):
-        console.print("[bold red]Error:[/bold red] Missing required environment variables.")
-        console.print("Please set WEBFLOW_API_TOKEN, WEBFLOW_SITE_ID, and WEBFLOW_COLLECTION_ID.")
-        console.print("You can create a .env file based on the .env.example template.")
-        return
-    
-    # Initialize the agent
-    agent = WebflowAgent(API_TOKEN, SITE_ID, COLLECTION_ID)
-    
-    # Execute the command
+def run_command(agent: WebflowAgent, args, parser) -> None:
+    """Execute a parsed CLI command using the given agent."""
     if args.command == "list":
         console.print("[bold blue]Listing documentation items...[/bold blue]")
-        items = agent.list_items()
+        items = agent.list_items(show_progress=True)
         display_items(items)
         
         if args.save:
@@ -313,19 +674,21 @@ def main():
         display_item(item)
     
     elif args.command == "extract":
-        console.print(f"[bold blue]Extracting content from item with ID: {args.item_id}[/bold blue]")
-        item = agent.get_item(args.item_id)
-        content = item.get("fieldData", {})
+        console.print(f"[bold blue]Extracting content from item(s) with ID: {', '.join(args.item_ids)}[/bold blue]")
+        items = agent.get_items(args.item_ids, args.concurrency)
         
-        console.print("[bold]Extracted content:[/bold]")
-        if isinstance(content, (dict, list)):
-            console.print(json.dumps(content, indent=2))
-        else:
-            console.print(str(content))
-        
-        if args.save:
-            file_path = agent.save_content_to_file(item, content, args.output_dir)
-            console.print(f"[bold green]Content saved to:[/bold green] {file_path}")
+        for item in items:
+            content = item.get("fieldData", {})
+            
+            console.print(f"[bold]Extracted content from {item.get('id')}:[/bold]")
+            if isinstance(content, (dict, list)):
+                console.print(_json_dumps(content).decode("utf-8"))
+            else:
+                console.print(str(content))
+            
+            if args.save:
+                file_path = agent.save_content_to_file(item, content, args.output_dir)
+                console.print(f"[bold green]Content saved to:[/bold green] {file_path}")
     
     elif args.command == "update":
         console.print(f"[bold blue]Updating content in item with ID: {args.item_id}[/bold blue]")
@@ -361,9 +724,96 @@ def main():
         console.print("[bold green]Item updated successfully![/bold green]")
         console.print(f"Updated at: {result.get('lastUpdated', 'Unknown')}")
     
+    elif args.command == "update-batch":
+        console.print(f"[bold blue]Updating items from file: {args.file}[/bold blue]")
+        
+        try:
+            with open(args.file, 'rb') as f:
+                updates = _json_loads(f.read())
+        except (OSError, ValueError) as e:
+            console.print(f"[bold red]Error:[/bold red] Could not read updates: {e}")
+            return
+        
+        if not isinstance(updates, list) or not all(isinstance(u, dict) and "id" in u for u in updates):
+            console.print("[bold red]Error:[/bold red] The file must contain a list of updates, each with an \"id\"")
+            return
+        
+        results = agent.update_items(updates)
+        console.print(f"[bold green]{len(results)} items updated successfully![/bold green]")
+    
     else:
         parser.print_help()
 
 
+def main():
+    """Main CLI function for the Webflow Documentation Agent."""
+    import argparse
+    
+    def positive_int(value: str) -> int:
+        """Parse a CLI value that must be an integer greater than zero."""
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+        return number
+    
+    # Create the argument parser
+    parser = argparse.ArgumentParser(description="Webflow Documentation Agent CLI")
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh data from Webflow instead of using cached responses")
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+    
+    # List command
+    list_parser = subparsers.add_parser("list", help="List all documentation items")
+    list_parser.add_argument("--save", action="store_true", help="Save the list to a file")
+    list_parser.add_argument("--output-dir", default="collection_items", help="Directory to save output files")
+    list_parser.add_argument("--filename", default="all_items.json", help="Filename for the saved list")
+    
+    # Get command
+    get_parser = subparsers.add_parser("get", help="Get a specific documentation item")
+    get_parser.add_argument("item_id", help="ID of the item to get")
+    
+    # Extract command
+    extract_parser = subparsers.add_parser("extract", help="Extract content from one or more documentation items")
+    extract_parser.add_argument("item_ids", nargs="+", metavar="item_id", help="ID(s) of the item(s) to extract content from")
+    extract_parser.add_argument("--concurrency", type=positive_int, default=10, help="Maximum number of items fetched at once")
+    extract_parser.add_argument("--save", action="store_true", help="Save the extracted content to a file")
+    extract_parser.add_argument("--output-dir", default="collection_items", help="Directory to save output files")
+    
+    # Update command
+    update_parser = subparsers.add_parser("update", help="Update a documentation item")
+    update_parser.add_argument("item_id", help="ID of the item to update")
+    update_parser.add_argument("--field-data", help="JSON string of field data to update")
+    update_parser.add_argument("--is-archived", type=bool, help="Set item archived status")
+    update_parser.add_argument("--is-draft", type=bool, help="Set item draft status")
+    update_parser.add_argument("--cms-locale-id", help="CMS locale ID for the item")
+    
+    # Batch update command
+    update_batch_parser = subparsers.add_parser("update-batch", help="Update many documentation items at once")
+    update_batch_parser.add_argument("--file", required=True, help="JSON file containing a list of item updates, each with an \"id\"")
+    
+    # Parse arguments
+    args = parser.parse_args()
+    
+    # Check for required environment variables
+    if not all([API_TOKEN, SITE_ID, COLLECTION_ID]):
+        console.print("[bold red]Error:[/bold red] Missing required environment variables.")
+        console.print("Please set WEBFLOW_API_TOKEN, WEBFLOW_SITE_ID, and WEBFLOW_COLLECTION_ID.")
+        console.print("You can create a .env file based on the .env.example template.")
+        return
+    
+    # Initialize the agent and execute the command
+    if args.no_cache:
+        agent = WebflowAgent(API_TOKEN, SITE_ID, COLLECTION_ID, cache_dir=None, cache_ttl=0)
+    else:
+        agent = WebflowAgent(API_TOKEN, SITE_ID, COLLECTION_ID, cache_dir=CACHE_DIR)
+    try:
+        with agent:
+            run_command(agent, args, parser)
+    except WebflowAgentError as e:
+        console.print(f"[bold red]Error making request:[/bold red] {str(e)}")
+        if e.response is not None:
+            console.print(f"Response: {e.response.text}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file